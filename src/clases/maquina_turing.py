@@ -25,6 +25,7 @@ class MaquinaTuring:
         self.cabezera = Cabezera(self.cinta)
         self.estado = "inicial"  # Estado actual de la máquina
         self.historial = []  # Historial de operaciones realizadas
+        self.observador = None  # Función llamada tras cada paso (opcional)
     
     def cambiar_estado(self, nuevo_estado):
         """
@@ -35,6 +36,16 @@ class MaquinaTuring:
         """
         self.estado = nuevo_estado
     
+    def notificar_paso(self):
+        """
+        Avisa al observador (si existe) de que la máquina dio un paso.
+        
+        Un paso es cada escritura y movimiento de la cabezera. Permite
+        visualizar la ejecución sin que la máquina conozca cómo se dibuja.
+        """
+        if self.observador is not None:
+            self.observador(self)
+    
     def obtener_estado(self):
         """
         Obtiene el estado actual de la máquina.
@@ -63,11 +74,14 @@ class MaquinaTuring:
         
         for i, simbolo in enumerate(entrada):
             self.cabezera.escribir(simbolo)
+            self.notificar_paso()
             self.cabezera.mover_derecha()
+            self.notificar_paso()
         
         # Volver al inicio
         self.cabezera.mover_a(0)
         self.cambiar_estado("preparado")
+        self.notificar_paso()
     
     def escribir_resultado(self, resultado):
         """
@@ -83,10 +97,13 @@ class MaquinaTuring:
         resultado_str = str(resultado)
         for simbolo in resultado_str:
             self.cabezera.escribir(simbolo)
+            self.notificar_paso()
             self.cabezera.mover_derecha()
+            self.notificar_paso()
         
         self.cabezera.mover_a(0)
         self.cambiar_estado("completado")
+        self.notificar_paso()
     
     def sumar(self, a, b):
         """
@@ -169,8 +186,11 @@ class MaquinaTuring:
             self.cabezera.mover_a(0)
             for simbolo in "ERROR":
                 self.cabezera.escribir(simbolo)
+                self.notificar_paso()
                 self.cabezera.mover_derecha()
+                self.notificar_paso()
             self.cambiar_estado("error")
+            self.notificar_paso()
         else:
             self.escribir_resultado(resultado)
         
@@ -5,6 +5,9 @@ Este programa demuestra el uso de la máquina de Turing para realizar
 operaciones matemáticas básicas.
 """
 
+import sys
+import time
+
 from clases.maquina_turing import MaquinaTuring
 
 
@@ -23,6 +26,7 @@ def mostrar_menu():
     print("7. Ver estado de la máquina")
     print("8. Ver historial")
     print("9. Reiniciar máquina")
+    print("10. Visualizar operación paso a paso")
     print("0. Salir")
     print("="*50)
 
@@ -92,6 +96,133 @@ def ejecutar_operacion(tm, opcion):
         print(f"Resultado: √{numero} = {resultado}")
 
 
+class VisualizadorCinta:
+    """
+    Dibuja la ejecución de la máquina en la terminal a una tasa fija.
+    
+    Se registra como observador de la máquina: la mayoría de los pasos
+    solo incrementan un contador y, cada cierto número de pasos, se
+    comprueba si ya toca un nuevo cuadro. Al dibujar solo se reescriben
+    las celdas de la ventana alrededor de la cabezera que cambiaron,
+    usando secuencias ANSI para mover el cursor.
+    """
+    
+    # Líneas dibujadas, de arriba abajo: celdas, marca de la cabezera y estado
+    LINEAS = 3
+    
+    def __init__(self, salida=None, fps=30, rango=15, tamano_bloque=64):
+        """
+        Inicializa el visualizador.
+        
+        Args:
+            salida: Flujo donde escribir (por defecto sys.stdout)
+            fps (int): Cuadros por segundo máximos
+            rango (int): Número de celdas a mostrar a cada lado de la cabezera
+            tamano_bloque (int): Pasos entre cada consulta del reloj
+        """
+        self.salida = salida if salida is not None else sys.stdout
+        self.intervalo = 1.0 / fps
+        self.rango = rango
+        self.tamano_bloque = tamano_bloque
+        self.pasos = 0
+        self.ultimo_cuadro = 0.0
+        self.celdas = None  # Celdas visibles en el último cuadro
+        self.columna_cabezera = None  # Columna de la marca '^' dibujada
+        self.centro = 0  # Posición de la cinta en el centro de la ventana
+        self.estado_anterior = None  # Estado de la máquina en el último paso
+    
+    def __call__(self, tm):
+        """
+        Registra un paso de la máquina y dibuja si corresponde.
+        
+        Los pasos en los que cambia el estado de la máquina siempre se
+        dibujan, así el primer y el último cuadro nunca se pierden.
+        
+        Args:
+            tm (MaquinaTuring): Máquina observada
+        """
+        self.pasos += 1
+        forzar = tm.estado != self.estado_anterior
+        if not forzar and self.pasos % self.tamano_bloque:
+            return
+        self.estado_anterior = tm.estado
+        ahora = time.perf_counter()
+        if forzar or ahora - self.ultimo_cuadro >= self.intervalo:
+            self.dibujar(tm)
+            self.ultimo_cuadro = ahora
+    
+    def _escribir_en(self, linea, columna, texto):
+        """
+        Escribe texto en una línea ya dibujada y devuelve el cursor abajo.
+        
+        Args:
+            linea (int): Línea contando desde arriba (0 a LINEAS - 1)
+            columna (int): Columna donde empezar (0 es la primera)
+            texto (str): Texto a escribir
+        """
+        subir = self.LINEAS - linea
+        return f"\x1b[{subir}A\x1b[{columna + 1}G{texto}\x1b[{subir}B\r"
+    
+    def dibujar(self, tm):
+        """
+        Dibuja un cuadro con el estado actual de la máquina.
+        
+        Args:
+            tm (MaquinaTuring): Máquina a dibujar
+        """
+        posicion = tm.cabezera.obtener_posicion()
+        
+        # Recentrar la ventana solo cuando la cabezera se acerca al borde
+        if abs(posicion - self.centro) > self.rango - 2:
+            self.centro = posicion
+        inicio = self.centro - self.rango
+        celdas = [tm.cinta.leer(i) for i in range(inicio, self.centro + self.rango + 1)]
+        columna_cabezera = posicion - inicio
+        estado = f"Estado: {tm.obtener_estado()} | Paso: {self.pasos}"
+        
+        if self.celdas is None:
+            # Primer cuadro: se dibuja todo
+            partes = [
+                ''.join(celdas) + "\n",
+                " " * columna_cabezera + "^\n",
+                estado + "\n",
+            ]
+        else:
+            partes = []
+            for columna, (antes, ahora) in enumerate(zip(self.celdas, celdas)):
+                if antes != ahora:
+                    partes.append(self._escribir_en(0, columna, ahora))
+            if columna_cabezera != self.columna_cabezera:
+                partes.append(self._escribir_en(1, self.columna_cabezera, " "))
+                partes.append(self._escribir_en(1, columna_cabezera, "^"))
+            partes.append(f"\x1b[1A\x1b[2K{estado}\n")
+        
+        self.salida.write(''.join(partes))
+        self.salida.flush()
+        self.celdas = celdas
+        self.columna_cabezera = columna_cabezera
+    
+
+def visualizar_operacion(tm):
+    """
+    Ejecuta una operación mostrando la cinta mientras la máquina trabaja.
+    
+    Args:
+        tm (MaquinaTuring): Instancia de la máquina de Turing
+    """
+    opcion = obtener_numero("Operación a visualizar (1-6): ")
+    if opcion not in range(1, 7):
+        print("Opción no válida.")
+        return
+    
+    visualizador = VisualizadorCinta()
+    tm.observador = visualizador
+    try:
+        ejecutar_operacion(tm, opcion)
+    finally:
+        tm.observador = None
+
+
 def mostrar_estado(tm):
     """Muestra el estado actual de la máquina."""
     print("\nESTADO DE LA MÁQUINA DE TURING:")
@@ -144,8 +275,11 @@ def main():
                 tm.reiniciar()
                 print("Máquina reiniciada correctamente.")
                 
+            elif opcion == 10:
+                visualizar_operacion(tm)
+                
             else:
-                print("Opción no válida. Por favor, selecciona una opción del 0 al 9.")
+                print("Opción no válida. Por favor, selecciona una opción del 0 al 10.")
                 
         except ValueError:
             print("Por favor, ingresa un número válido.")